@@ -0,0 +1,457 @@
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+
+from car_avl_tree import Car, AVLTree, AVLTreeInterface
+from car_btree import BTree
+from student_queue import Student, StudentQueue
+
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+REPEATS = 20
+# Below this many samples the nearest-rank p95 is just the maximum.
+MIN_P95_SAMPLES = 20
+WARMUP = 1
+SEED = 42
+THRESHOLD = 0.10
+
+# Point lookups are capped so that the largest sizes stay tractable;
+# linear scans get a budget of visited elements instead of a fixed count.
+MAX_LOOKUPS = 100_000
+SCAN_BUDGET = 1_000_000
+# Prices are spaced ~100 apart on average, so a range query returns ~100 cars.
+RANGE_QUERIES = 1_000
+RANGE_WIDTH = 10_000
+
+
+@dataclass
+class Dataset:
+    cars: List[Car]
+    sorted_cars: List[Car]
+    students: List[Student]
+    lookup_prices: List[float]
+    lookup_ranges: List[Tuple[float, float]]
+    lookup_cars: List[Car]
+    scan_vins: List[str]
+    scan_students: List[Student]
+    scan_names: List[str]
+
+
+@dataclass
+class Benchmark:
+    structure: str
+    operation: str
+    setup: Callable[[Dataset], object]
+    run: Callable[[object, Dataset], int]
+    # Mutating operations get a freshly built structure for every run;
+    # read-only ones reuse a single build per size.
+    mutates: bool = False
+
+
+@dataclass
+class TreeBackend:
+    factory: Callable[[], AVLTreeInterface]
+    bulk_load: Callable[[AVLTreeInterface, List[Car]], None]
+
+
+@dataclass
+class Result:
+    structure: str
+    operation: str
+    size: int
+    ops: int
+    repeats: int
+    median_ns_per_op: float
+    p95_ns_per_op: Optional[float]
+    min_ns_per_op: float
+    max_ns_per_op: float
+    # Peak allocated while the operation runs, excluding the prebuilt structure.
+    peak_memory_bytes: int
+    # Memory held by the structure itself after the operation (cars are shared and not counted).
+    structure_memory_bytes: int
+
+
+def generate_cars(n: int, rng: random.Random) -> List[Car]:
+    prices = rng.sample(range(10_000, 10_000 + 100 * n), n)
+    return [
+        Car(
+            ''.join(rng.choices(string.ascii_uppercase, k=5)),
+            ''.join(rng.choices(string.ascii_uppercase + string.digits, k=17)),
+            round(rng.uniform(1.0, 5.0), 1),
+            float(price),
+            round(rng.uniform(120, 250), 0))
+        for price in prices
+    ]
+
+
+def generate_students(n: int, rng: random.Random) -> List[Student]:
+    return [
+        Student(
+            ''.join(rng.choices(string.ascii_letters, k=10)),
+            f"Group{rng.randint(1, 5)}",
+            rng.randint(1, 5),
+            rng.randint(18, 25),
+            round(rng.uniform(2.0, 5.0), 1))
+        for _ in range(n)
+    ]
+
+
+def scan_count(n: int) -> int:
+    return max(1, min(n, SCAN_BUDGET // n))
+
+
+def make_dataset(n: int, seed: int = SEED) -> Dataset:
+    rng = random.Random(seed)
+    cars = generate_cars(n, rng)
+    students = generate_students(n, rng)
+    lookups = min(n, MAX_LOOKUPS)
+    scans = scan_count(n)
+    scan_students = rng.choices(students, k=scans)
+    return Dataset(
+        cars=cars,
+        sorted_cars=sorted(cars, key=lambda car: car.price),
+        students=students,
+        lookup_prices=[car.price for car in rng.choices(cars, k=lookups)],
+        lookup_ranges=[(car.price, car.price + RANGE_WIDTH)
+                       for car in rng.choices(cars, k=min(n, RANGE_QUERIES))],
+        lookup_cars=rng.choices(cars, k=lookups),
+        scan_vins=[car.vin for car in rng.choices(cars, k=scans)],
+        scan_students=scan_students,
+        scan_names=[student.full_name for student in scan_students])
+
+
+def tree_builder(factory: Callable[[], AVLTreeInterface]) -> Callable[[Dataset], AVLTreeInterface]:
+    def build(data: Dataset) -> AVLTreeInterface:
+        tree = factory()
+        for car in data.cars:
+            tree.insert(car)
+        return tree
+    return build
+
+
+def build_queue(data: Dataset) -> StudentQueue:
+    queue = StudentQueue()
+    for student in data.students:
+        queue.enqueue(student)
+    return queue
+
+
+def run_tree_insert(tree: AVLTreeInterface, data: Dataset) -> int:
+    for car in data.cars:
+        tree.insert(car)
+    return len(data.cars)
+
+
+def run_tree_search(tree: AVLTreeInterface, data: Dataset) -> int:
+    for price in data.lookup_prices:
+        tree.search(price)
+    return len(data.lookup_prices)
+
+
+def run_tree_range_search(tree: AVLTreeInterface, data: Dataset) -> int:
+    for low, high in data.lookup_ranges:
+        tree.range_search(low, high)
+    return len(data.lookup_ranges)
+
+
+def insert_all(tree: AVLTreeInterface, cars: List[Car]) -> None:
+    for car in cars:
+        tree.insert(car)
+
+
+def bulk_loader(load: Callable[[AVLTreeInterface, List[Car]], None]) -> Callable[[AVLTreeInterface, Dataset], int]:
+    def run(tree: AVLTreeInterface, data: Dataset) -> int:
+        load(tree, data.sorted_cars)
+        return len(data.sorted_cars)
+    return run
+
+
+def run_tree_delete(tree: AVLTreeInterface, data: Dataset) -> int:
+    for car in data.cars:
+        tree.delete(car.price)
+    return len(data.cars)
+
+
+def run_tree_contains(tree: AVLTreeInterface, data: Dataset) -> int:
+    for car in data.lookup_cars:
+        tree.contains(car)
+    return len(data.lookup_cars)
+
+
+def run_tree_contains_by_vin(tree: AVLTreeInterface, data: Dataset) -> int:
+    for vin in data.scan_vins:
+        tree.contains_by_vin(vin)
+    return len(data.scan_vins)
+
+
+def run_queue_enqueue(queue: StudentQueue, data: Dataset) -> int:
+    for student in data.students:
+        queue.enqueue(student)
+    return len(data.students)
+
+
+def run_queue_dequeue(queue: StudentQueue, data: Dataset) -> int:
+    for _ in range(len(data.students)):
+        queue.dequeue()
+    return len(data.students)
+
+
+def run_queue_reverse(queue: StudentQueue, data: Dataset) -> int:
+    queue.reverse()
+    return len(data.students)
+
+
+def run_queue_contains(queue: StudentQueue, data: Dataset) -> int:
+    for student in data.scan_students:
+        queue.contains(student)
+    return len(data.scan_students)
+
+
+def run_queue_contains_by_name(queue: StudentQueue, data: Dataset) -> int:
+    for name in data.scan_names:
+        queue.contains_by_name(name)
+    return len(data.scan_names)
+
+
+# AVLTree has no bulk loader of its own, so it inserts the sorted cars one by one.
+TREES: Dict[str, TreeBackend] = {
+    "avl_tree": TreeBackend(AVLTree, insert_all),
+    "btree": TreeBackend(BTree, BTree.bulk_load),
+}
+
+BENCHMARKS: List[Benchmark] = [
+    benchmark
+    for name, backend in TREES.items()
+    for benchmark in (
+        Benchmark(name, "insert", lambda data, backend=backend: backend.factory(), run_tree_insert,
+                  mutates=True),
+        Benchmark(name, "bulk_load", lambda data, backend=backend: backend.factory(),
+                  bulk_loader(backend.bulk_load), mutates=True),
+        Benchmark(name, "search", tree_builder(backend.factory), run_tree_search),
+        Benchmark(name, "range_search", tree_builder(backend.factory), run_tree_range_search),
+        Benchmark(name, "delete", tree_builder(backend.factory), run_tree_delete, mutates=True),
+        Benchmark(name, "contains", tree_builder(backend.factory), run_tree_contains),
+        Benchmark(name, "contains_by_vin", tree_builder(backend.factory), run_tree_contains_by_vin),
+    )
+] + [
+    Benchmark("student_queue", "enqueue", lambda data: StudentQueue(), run_queue_enqueue, mutates=True),
+    Benchmark("student_queue", "dequeue", build_queue, run_queue_dequeue, mutates=True),
+    Benchmark("student_queue", "reverse", build_queue, run_queue_reverse, mutates=True),
+    Benchmark("student_queue", "contains", build_queue, run_queue_contains),
+    Benchmark("student_queue", "contains_by_name", build_queue, run_queue_contains_by_name),
+]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def time_once(benchmark: Benchmark, state: object, data: Dataset) -> Tuple[int, int]:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        ops = benchmark.run(state, data)
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return elapsed, ops
+
+
+def traced_setup(benchmark: Benchmark, data: Dataset) -> Tuple[object, int]:
+    tracemalloc.start()
+    try:
+        state = benchmark.setup(data)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return state, retained
+
+
+def memory_usage(benchmark: Benchmark, shared: Optional[object], data: Dataset) -> Tuple[int, int]:
+    tracemalloc.start()
+    try:
+        state = benchmark.setup(data) if shared is None else shared
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        benchmark.run(state, data)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before, retained
+
+
+def measure(benchmark: Benchmark, data: Dataset, size: int,
+            repeats: int = REPEATS, warmup: int = WARMUP) -> Result:
+    # The shared build is traced so read-only rows still report the structure's footprint.
+    shared, setup_bytes = (None, 0) if benchmark.mutates else traced_setup(benchmark, data)
+
+    def fresh_state() -> object:
+        return benchmark.setup(data) if benchmark.mutates else shared
+
+    for _ in range(warmup):
+        time_once(benchmark, fresh_state(), data)
+
+    samples = []
+    ops = 0
+    for _ in range(repeats):
+        elapsed, ops = time_once(benchmark, fresh_state(), data)
+        samples.append(elapsed / ops)
+
+    # Measured in a separate run: tracing allocations distorts timings.
+    peak, retained = memory_usage(benchmark, shared, data)
+
+    return Result(
+        structure=benchmark.structure,
+        operation=benchmark.operation,
+        size=size,
+        ops=ops,
+        repeats=repeats,
+        median_ns_per_op=statistics.median(samples),
+        p95_ns_per_op=percentile(samples, 95) if len(samples) >= MIN_P95_SAMPLES else None,
+        min_ns_per_op=min(samples),
+        max_ns_per_op=max(samples),
+        peak_memory_bytes=peak,
+        structure_memory_bytes=setup_bytes + retained)
+
+
+def run_benchmarks(sizes: Sequence[int] = SIZES, repeats: int = REPEATS, warmup: int = WARMUP,
+                   seed: int = SEED, structures: Optional[Sequence[str]] = None,
+                   report: Optional[Callable[[Result], None]] = None) -> List[Result]:
+    selected = [b for b in BENCHMARKS if structures is None or b.structure in structures]
+    results = []
+    for size in sizes:
+        data = make_dataset(size, seed)
+        for benchmark in selected:
+            result = measure(benchmark, data, size, repeats, warmup)
+            results.append(result)
+            if report:
+                report(result)
+    return results
+
+
+def results_to_json(results: Sequence[Result], repeats: int, warmup: int, seed: int) -> Dict:
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "warmup": warmup,
+            "seed": seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def save_results(payload: Dict, filename: str) -> None:
+    with open(filename, 'w') as file:
+        json.dump(payload, file, indent=2)
+
+
+def load_results(filename: str) -> Dict:
+    with open(filename) as file:
+        return json.load(file)
+
+
+def result_key(entry: Dict) -> Tuple[str, str, int]:
+    return entry["structure"], entry["operation"], entry["size"]
+
+
+def unmatched(current: Dict, baseline: Dict) -> List[Tuple[str, str, int]]:
+    reference = {result_key(entry) for entry in baseline["results"]}
+    return [result_key(entry) for entry in current["results"] if result_key(entry) not in reference]
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = THRESHOLD) -> List[Dict]:
+    reference = {result_key(entry): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in current["results"]:
+        old = reference.get(result_key(entry))
+        if old is None:
+            continue
+        ratio = entry["median_ns_per_op"] / old["median_ns_per_op"]
+        if ratio > 1 + threshold:
+            regressions.append({
+                "structure": entry["structure"],
+                "operation": entry["operation"],
+                "size": entry["size"],
+                "baseline_ns_per_op": old["median_ns_per_op"],
+                "current_ns_per_op": entry["median_ns_per_op"],
+                "ratio": ratio,
+            })
+    return regressions
+
+
+def print_result(result: Result) -> None:
+    p95 = f"{result.p95_ns_per_op:.1f}" if result.p95_ns_per_op is not None else "-"
+    print(f"{result.structure:<14} {result.operation:<17} {result.size:>9} "
+          f"{result.median_ns_per_op:>14.1f} {p95:>14} {result.max_ns_per_op:>14.1f} "
+          f"{result.peak_memory_bytes / 1024:>12.1f} {result.structure_memory_bytes / 1024:>12.1f}")
+
+
+def print_header() -> None:
+    print(f"{'structure':<14} {'operation':<17} {'size':>9} "
+          f"{'median ns/op':>14} {'p95 ns/op':>14} {'max ns/op':>14} {'op peak KiB':>12} {'struct KiB':>12}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks for AVLTree, BTree and StudentQueue")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeats", type=int, default=REPEATS,
+                        help=f"timed runs per benchmark; p95 is reported only with at least {MIN_P95_SAMPLES}")
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--structures", nargs="+", choices=sorted({b.structure for b in BENCHMARKS}))
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline",
+                        help="JSON results to compare against; exits 2 if no result matches the baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown of the median before flagging a regression")
+    args = parser.parse_args(argv)
+
+    print_header()
+    results = run_benchmarks(args.sizes, args.repeats, args.warmup, args.seed,
+                             args.structures, print_result)
+    payload = results_to_json(results, args.repeats, args.warmup, args.seed)
+
+    if args.output:
+        save_results(payload, args.output)
+
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        missing = unmatched(payload, baseline)
+        for structure, operation, size in missing:
+            print(f"NOT IN BASELINE {structure} {operation} size={size}")
+        if missing and len(missing) == len(payload["results"]):
+            print("No results overlap with the baseline; nothing was compared.")
+            return 2
+
+        regressions = compare(payload, baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['structure']} {r['operation']} size={r['size']}: "
+                  f"{r['baseline_ns_per_op']:.1f} -> {r['current_ns_per_op']:.1f} ns/op "
+                  f"(x{r['ratio']:.2f})")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
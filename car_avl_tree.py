@@ -1,8 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Callable, Dict, Optional, List
 import pickle
+import time
+
+from instrumentation import OperationEvent, Recorder
 
 
 @dataclass
@@ -35,6 +38,10 @@ class AVLTreeInterface(ABC):
     def search(self, price: float) -> Optional[Car]:
         pass
 
+    @abstractmethod
+    def range_search(self, low: float, high: float) -> List[Car]:
+        pass
+
     @abstractmethod
     def contains(self, car: Car) -> bool:
         pass
@@ -192,6 +199,21 @@ class AVLTree(AVLTreeInterface):
             return self._search(root.left, price)
         return self._search(root.right, price)
 
+    def range_search(self, low: float, high: float) -> List[Car]:
+        result = []
+        self._range_search(self.root, low, high, result)
+        return result
+
+    def _range_search(self, root: Optional[Node], low: float, high: float, result: List[Car]) -> None:
+        if root is None:
+            return
+        if low < root.car.price:
+            self._range_search(root.left, low, high, result)
+        if low <= root.car.price <= high:
+            result.append(root.car)
+        if root.car.price < high:
+            self._range_search(root.right, low, high, result)
+
     def contains(self, car: Car) -> bool:
         return self.search(car.price) is not None
 
@@ -226,6 +248,95 @@ class AVLTree(AVLTreeInterface):
         return result
 
 
+class InstrumentedAVLTree(AVLTree):
+    def __init__(self, callback: Optional[Callable[[OperationEvent], None]] = None):
+        super().__init__()
+        self.recorder = Recorder(callback)
+
+    def stats(self) -> Dict:
+        return {"height": self.height(self.root), "operations": self.recorder.stats()}
+
+    def right_rotate(self, y: Node) -> Node:
+        self.recorder.rotations += 1
+        return super().right_rotate(y)
+
+    def left_rotate(self, x: Node) -> Node:
+        self.recorder.rotations += 1
+        return super().left_rotate(x)
+
+    def insert(self, car: Car) -> None:
+        start = time.perf_counter_ns()
+        super().insert(car)
+        self.recorder.record("insert", time.perf_counter_ns() - start)
+
+    def _insert(self, node: Optional[Node], car: Car) -> Node:
+        if node:
+            self.recorder.nodes_visited += 1
+            self.recorder.comparisons += 1 if car.price < node.car.price else 2
+        return super()._insert(node, car)
+
+    def delete(self, price: float) -> None:
+        start = time.perf_counter_ns()
+        super().delete(price)
+        self.recorder.record("delete", time.perf_counter_ns() - start)
+
+    def _delete(self, root: Optional[Node], price: float) -> Optional[Node]:
+        if root:
+            self.recorder.nodes_visited += 1
+            self.recorder.comparisons += 1 if price < root.car.price else 2
+        return super()._delete(root, price)
+
+    def _min_value_node(self, node: Node) -> Node:
+        current = node
+        self.recorder.nodes_visited += 1
+        while current.left is not None:
+            current = current.left
+            self.recorder.nodes_visited += 1
+        return current
+
+    def search(self, price: float) -> Optional[Car]:
+        start = time.perf_counter_ns()
+        result = self._search(self.root, price)
+        self.recorder.record("search", time.perf_counter_ns() - start)
+        return result
+
+    def _search(self, root: Optional[Node], price: float) -> Optional[Car]:
+        if root is not None:
+            self.recorder.nodes_visited += 1
+            self.recorder.comparisons += 1 if root.car.price == price else 2
+        return super()._search(root, price)
+
+    def range_search(self, low: float, high: float) -> List[Car]:
+        start = time.perf_counter_ns()
+        result = super().range_search(low, high)
+        self.recorder.record("range_search", time.perf_counter_ns() - start)
+        return result
+
+    def _range_search(self, root: Optional[Node], low: float, high: float, result: List[Car]) -> None:
+        if root is not None:
+            self.recorder.nodes_visited += 1
+            self.recorder.comparisons += 4 if low <= root.car.price else 3
+        super()._range_search(root, low, high, result)
+
+    def contains(self, car: Car) -> bool:
+        start = time.perf_counter_ns()
+        result = self._search(self.root, car.price) is not None
+        self.recorder.record("contains", time.perf_counter_ns() - start)
+        return result
+
+    def contains_by_vin(self, vin: str) -> bool:
+        start = time.perf_counter_ns()
+        result = self._contains_by_vin(self.root, vin)
+        self.recorder.record("contains_by_vin", time.perf_counter_ns() - start)
+        return result
+
+    def _contains_by_vin(self, node: Optional[Node], vin: str) -> bool:
+        if node is not None:
+            self.recorder.nodes_visited += 1
+            self.recorder.comparisons += 1
+        return super()._contains_by_vin(node, vin)
+
+
 if __name__ == "__main__":
     avl_tree = AVLTree()
 
@@ -0,0 +1,252 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import pickle
+
+from car_avl_tree import Car, AVLTreeInterface
+
+
+class LeafNode:
+    __slots__ = ("keys", "cars", "next")
+
+    def __init__(self, keys: Optional[List[float]] = None, cars: Optional[List[Car]] = None):
+        self.keys: List[float] = keys if keys is not None else []
+        self.cars: List[Car] = cars if cars is not None else []
+        self.next: Optional[LeafNode] = None
+
+
+class InternalNode:
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys: List[float], children: List[BTreeNode]):
+        self.keys = keys
+        self.children = children
+
+
+BTreeNode = Union[LeafNode, InternalNode]
+
+
+def _chunks(items: Sequence, capacity: int) -> List[Sequence]:
+    count = -(-len(items) // capacity)
+    size, extra = divmod(len(items), count)
+    result = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        result.append(items[start:end])
+        start = end
+    return result
+
+
+class BTree(AVLTreeInterface):
+    def __init__(self, fanout: int = 64):
+        if fanout < 3:
+            raise ValueError("fanout must be at least 3")
+        self.fanout = fanout
+        self.max_keys = fanout - 1
+        self.min_leaf_keys = fanout // 2
+        self.min_children = (fanout + 1) // 2
+        self.root: BTreeNode = LeafNode()
+
+    def _find_leaf(self, price: float) -> LeafNode:
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[bisect_right(node.keys, price)]
+        return node
+
+    def _leftmost_leaf(self) -> LeafNode:
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[0]
+        return node
+
+    def _leaves(self) -> Iterator[LeafNode]:
+        leaf = self._leftmost_leaf()
+        while leaf is not None:
+            yield leaf
+            leaf = leaf.next
+
+    def insert(self, car: Car) -> None:
+        split = self._insert(self.root, car)
+        if split:
+            key, right = split
+            self.root = InternalNode([key], [self.root, right])
+
+    def _insert(self, node: BTreeNode, car: Car) -> Optional[Tuple[float, BTreeNode]]:
+        if isinstance(node, LeafNode):
+            i = bisect_left(node.keys, car.price)
+            if i < len(node.keys) and node.keys[i] == car.price:
+                node.cars[i] = car
+                return None
+            node.keys.insert(i, car.price)
+            node.cars.insert(i, car)
+            if len(node.keys) <= self.max_keys:
+                return None
+            mid = len(node.keys) // 2
+            right = LeafNode(node.keys[mid:], node.cars[mid:])
+            del node.keys[mid:]
+            del node.cars[mid:]
+            right.next = node.next
+            node.next = right
+            return right.keys[0], right
+
+        i = bisect_right(node.keys, car.price)
+        split = self._insert(node.children[i], car)
+        if split is None:
+            return None
+        key, child = split
+        node.keys.insert(i, key)
+        node.children.insert(i + 1, child)
+        if len(node.children) <= self.fanout:
+            return None
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        right = InternalNode(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+        return separator, right
+
+    def delete(self, price: float) -> None:
+        self._delete(self.root, price)
+        if isinstance(self.root, InternalNode) and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+    def _delete(self, node: BTreeNode, price: float) -> None:
+        if isinstance(node, LeafNode):
+            i = bisect_left(node.keys, price)
+            if i < len(node.keys) and node.keys[i] == price:
+                del node.keys[i]
+                del node.cars[i]
+            return
+
+        i = bisect_right(node.keys, price)
+        child = node.children[i]
+        self._delete(child, price)
+        if isinstance(child, LeafNode):
+            if len(child.keys) < self.min_leaf_keys:
+                self._rebalance_leaf(node, i)
+        elif len(child.children) < self.min_children:
+            self._rebalance_internal(node, i)
+
+    def _rebalance_leaf(self, parent: InternalNode, i: int) -> None:
+        child = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+
+        if left is not None and len(left.keys) > self.min_leaf_keys:
+            child.keys.insert(0, left.keys.pop())
+            child.cars.insert(0, left.cars.pop())
+            parent.keys[i - 1] = child.keys[0]
+        elif right is not None and len(right.keys) > self.min_leaf_keys:
+            child.keys.append(right.keys.pop(0))
+            child.cars.append(right.cars.pop(0))
+            parent.keys[i] = right.keys[0]
+        elif left is not None:
+            left.keys.extend(child.keys)
+            left.cars.extend(child.cars)
+            left.next = child.next
+            del parent.keys[i - 1]
+            del parent.children[i]
+        else:
+            child.keys.extend(right.keys)
+            child.cars.extend(right.cars)
+            child.next = right.next
+            del parent.keys[i]
+            del parent.children[i + 1]
+
+    def _rebalance_internal(self, parent: InternalNode, i: int) -> None:
+        child = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+
+        if left is not None and len(left.children) > self.min_children:
+            child.keys.insert(0, parent.keys[i - 1])
+            child.children.insert(0, left.children.pop())
+            parent.keys[i - 1] = left.keys.pop()
+        elif right is not None and len(right.children) > self.min_children:
+            child.keys.append(parent.keys[i])
+            child.children.append(right.children.pop(0))
+            parent.keys[i] = right.keys.pop(0)
+        elif left is not None:
+            left.keys.append(parent.keys[i - 1])
+            left.keys.extend(child.keys)
+            left.children.extend(child.children)
+            del parent.keys[i - 1]
+            del parent.children[i]
+        else:
+            child.keys.append(parent.keys[i])
+            child.keys.extend(right.keys)
+            child.children.extend(right.children)
+            del parent.keys[i]
+            del parent.children[i + 1]
+
+    def search(self, price: float) -> Optional[Car]:
+        leaf = self._find_leaf(price)
+        i = bisect_left(leaf.keys, price)
+        if i < len(leaf.keys) and leaf.keys[i] == price:
+            return leaf.cars[i]
+        return None
+
+    def range_search(self, low: float, high: float) -> List[Car]:
+        result = []
+        leaf = self._find_leaf(low)
+        i = bisect_left(leaf.keys, low)
+        while leaf is not None:
+            end = bisect_right(leaf.keys, high)
+            result.extend(leaf.cars[i:end])
+            if end < len(leaf.keys):
+                break
+            leaf = leaf.next
+            i = 0
+        return result
+
+    def contains(self, car: Car) -> bool:
+        return self.search(car.price) is not None
+
+    def contains_by_vin(self, vin: str) -> bool:
+        for leaf in self._leaves():
+            for car in leaf.cars:
+                if car.vin == vin:
+                    return True
+        return False
+
+    def bulk_load(self, cars: Sequence[Car]) -> None:
+        by_price = {}
+        for car in sorted(cars, key=lambda c: c.price):
+            by_price[car.price] = car
+        if not by_price:
+            self.root = LeafNode()
+            return
+
+        ordered = list(by_price.values())
+        leaves = []
+        for chunk in _chunks(ordered, self.max_keys):
+            leaf = LeafNode([car.price for car in chunk], list(chunk))
+            if leaves:
+                leaves[-1].next = leaf
+            leaves.append(leaf)
+
+        level: List[BTreeNode] = leaves
+        low_keys = [leaf.keys[0] for leaf in leaves]
+        while len(level) > 1:
+            parents = []
+            parent_low_keys = []
+            start = 0
+            for chunk in _chunks(level, self.fanout):
+                keys = low_keys[start + 1:start + len(chunk)]
+                parents.append(InternalNode(keys, list(chunk)))
+                parent_low_keys.append(low_keys[start])
+                start += len(chunk)
+            level = parents
+            low_keys = parent_low_keys
+        self.root = level[0]
+
+    def save_to_file(self, filename: str) -> None:
+        cars = [car for leaf in self._leaves() for car in leaf.cars]
+        with open(filename, 'wb') as file:
+            pickle.dump(cars, file)
+
+    def load_from_file(self, filename: str) -> None:
+        with open(filename, 'rb') as file:
+            cars = pickle.load(file)
+        self.bulk_load(cars)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+
+@dataclass
+class OperationEvent:
+    operation: str
+    latency_ns: int
+    comparisons: int
+    nodes_visited: int
+    rotations: int
+
+
+@dataclass
+class OperationStats:
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    comparisons: int = 0
+    nodes_visited: int = 0
+    max_nodes_visited: int = 0
+    rotations: int = 0
+    max_rotations: int = 0
+    # Upper bound of a power-of-two latency bucket in ns -> number of operations.
+    histogram: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, event: OperationEvent) -> None:
+        self.count += 1
+        self.total_ns += event.latency_ns
+        self.max_ns = max(self.max_ns, event.latency_ns)
+        self.comparisons += event.comparisons
+        self.nodes_visited += event.nodes_visited
+        self.max_nodes_visited = max(self.max_nodes_visited, event.nodes_visited)
+        self.rotations += event.rotations
+        self.max_rotations = max(self.max_rotations, event.rotations)
+        bucket = 1 << event.latency_ns.bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.count if self.count else 0.0,
+            "max_ns": self.max_ns,
+            "comparisons": self.comparisons,
+            "nodes_visited": self.nodes_visited,
+            "max_nodes_visited": self.max_nodes_visited,
+            "rotations": self.rotations,
+            "max_rotations": self.max_rotations,
+            "histogram": dict(sorted(self.histogram.items())),
+        }
+
+
+class Recorder:
+    def __init__(self, callback: Optional[Callable[[OperationEvent], None]] = None):
+        self.callback = callback
+        self.operations: Dict[str, OperationStats] = {}
+        self.comparisons = 0
+        self.nodes_visited = 0
+        self.rotations = 0
+
+    def record(self, operation: str, latency_ns: int) -> None:
+        event = OperationEvent(operation, latency_ns, self.comparisons, self.nodes_visited, self.rotations)
+        self.comparisons = self.nodes_visited = self.rotations = 0
+
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = OperationStats()
+        stats.add(event)
+
+        if self.callback:
+            self.callback(event)
+
+    def reset(self) -> None:
+        self.operations.clear()
+        self.comparisons = self.nodes_visited = self.rotations = 0
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: stats.snapshot() for name, stats in self.operations.items()}
@@ -1,8 +1,11 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field, InitVar
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Dict, Optional
 import pickle
+import time
+
+from instrumentation import OperationEvent, Recorder
 
 
 @dataclass
@@ -139,6 +142,57 @@ class StudentQueue(QueueInterface):
         return self._size
 
 
+@dataclass
+class InstrumentedStudentQueue(StudentQueue):
+    callback: InitVar[Optional[Callable[[OperationEvent], None]]] = None
+    recorder: Recorder = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self, callback: Optional[Callable[[OperationEvent], None]]) -> None:
+        self.recorder = Recorder(callback)
+
+    def stats(self) -> Dict:
+        return {"size": self._size, "operations": self.recorder.stats()}
+
+    def enqueue(self, item: Student) -> None:
+        start = time.perf_counter_ns()
+        super().enqueue(item)
+        self.recorder.record("enqueue", time.perf_counter_ns() - start)
+
+    def dequeue(self) -> Optional[Student]:
+        start = time.perf_counter_ns()
+        item = super().dequeue()
+        self.recorder.record("dequeue", time.perf_counter_ns() - start)
+        return item
+
+    def reverse(self) -> None:
+        start = time.perf_counter_ns()
+        super().reverse()
+        self.recorder.nodes_visited += self._size
+        self.recorder.record("reverse", time.perf_counter_ns() - start)
+
+    def contains(self, item: Student) -> bool:
+        start = time.perf_counter_ns()
+        found = self._counted_scan(lambda data: data == item)
+        self.recorder.record("contains", time.perf_counter_ns() - start)
+        return found
+
+    def contains_by_name(self, full_name: str) -> bool:
+        start = time.perf_counter_ns()
+        found = self._counted_scan(lambda data: data.full_name == full_name)
+        self.recorder.record("contains_by_name", time.perf_counter_ns() - start)
+        return found
+
+    def _counted_scan(self, predicate: Callable[[Student], bool]) -> bool:
+        current = self.head
+        while current:
+            self.recorder.nodes_visited += 1
+            self.recorder.comparisons += 1
+            if predicate(current.data):
+                return True
+            current = current.next
+        return False
+
+
 if __name__ == "__main__":
     queue = StudentQueue()
 
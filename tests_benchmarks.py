@@ -0,0 +1,147 @@
+import unittest
+import contextlib
+import io
+import os
+from benchmarks import (BENCHMARKS, MAX_LOOKUPS, MIN_P95_SAMPLES, TREES, Benchmark, bulk_loader,
+                        compare, load_results, main, make_dataset, measure, percentile,
+                        results_to_json, run_benchmarks, run_tree_insert, run_tree_search,
+                        save_results, scan_count, unmatched)
+from car_avl_tree import AVLTree
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_dataset_is_seeded(self):
+        first = make_dataset(50, seed=7)
+        second = make_dataset(50, seed=7)
+
+        self.assertEqual(first.cars, second.cars)
+        self.assertEqual(first.students, second.students)
+        self.assertEqual(first.lookup_prices, second.lookup_prices)
+
+    def test_dataset_prices_are_unique(self):
+        data = make_dataset(1000)
+
+        self.assertEqual(len({car.price for car in data.cars}), 1000)
+
+    def test_scan_count(self):
+        self.assertEqual(scan_count(100), 100)
+        self.assertEqual(scan_count(10 ** 6), 1)
+
+    def test_point_lookups_not_limited_by_scan_budget(self):
+        data = make_dataset(20_000)
+        benchmark = next(b for b in BENCHMARKS if (b.structure, b.operation) == ("avl_tree", "contains"))
+
+        ops = benchmark.run(AVLTree(), data)
+
+        self.assertEqual(ops, min(20_000, MAX_LOOKUPS))
+        self.assertEqual(len(data.scan_vins), scan_count(20_000))
+
+    def test_setup_runs_once_for_read_only_benchmarks(self):
+        calls = []
+
+        def setup(data):
+            calls.append(data)
+            return AVLTree()
+
+        data = make_dataset(20)
+        measure(Benchmark("avl_tree", "search", setup, run_tree_search), data, 20, repeats=3, warmup=1)
+        self.assertEqual(len(calls), 1)
+
+        calls.clear()
+        measure(Benchmark("avl_tree", "insert", setup, run_tree_insert, mutates=True), data, 20,
+                repeats=3, warmup=1)
+        self.assertEqual(len(calls), 5)
+
+    def test_structure_memory(self):
+        results = {(r.structure, r.operation): r
+                   for r in run_benchmarks(sizes=[1000], repeats=1, warmup=0)}
+
+        for operation in ("insert", "bulk_load", "search", "range_search", "contains", "contains_by_vin"):
+            self.assertGreater(results["avl_tree", operation].structure_memory_bytes, 0, operation)
+            self.assertGreater(results["btree", operation].structure_memory_bytes, 0, operation)
+        self.assertGreater(results["student_queue", "contains"].structure_memory_bytes, 0)
+        self.assertLess(results["btree", "search"].structure_memory_bytes,
+                        results["avl_tree", "search"].structure_memory_bytes)
+        self.assertLess(results["avl_tree", "delete"].structure_memory_bytes,
+                        results["avl_tree", "search"].structure_memory_bytes)
+
+    def test_tree_backends_bulk_load(self):
+        data = make_dataset(200)
+
+        for name, backend in TREES.items():
+            tree = backend.factory()
+            ops = bulk_loader(backend.bulk_load)(tree, data)
+
+            self.assertEqual(ops, 200, name)
+            self.assertEqual(tree.range_search(float("-inf"), float("inf")), data.sorted_cars, name)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile([3, 1, 2], 100), 3)
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(sizes=[20], repeats=2, warmup=0)
+
+        self.assertEqual(len(results), len(BENCHMARKS))
+        for result in results:
+            self.assertEqual(result.size, 20)
+            self.assertGreater(result.ops, 0)
+            self.assertGreater(result.median_ns_per_op, 0)
+            self.assertIsNone(result.p95_ns_per_op)
+            self.assertGreaterEqual(result.max_ns_per_op, result.median_ns_per_op)
+
+    def test_p95_needs_enough_samples(self):
+        result = run_benchmarks(sizes=[20], repeats=MIN_P95_SAMPLES, warmup=0, structures=["avl_tree"])[0]
+
+        self.assertIsNotNone(result.p95_ns_per_op)
+        self.assertLessEqual(result.p95_ns_per_op, result.max_ns_per_op)
+        self.assertGreaterEqual(result.p95_ns_per_op, result.median_ns_per_op)
+
+    def test_save_load_and_compare(self):
+        results = run_benchmarks(sizes=[20], repeats=1, warmup=0, structures=["avl_tree"])
+        payload = results_to_json(results, 1, 0, 42)
+
+        save_results(payload, "test_bench.json")
+        baseline = load_results("test_bench.json")
+        os.remove("test_bench.json")
+
+        self.assertEqual(compare(payload, baseline), [])
+
+        for entry in baseline["results"]:
+            entry["median_ns_per_op"] /= 2
+        regressions = compare(payload, baseline, threshold=0.1)
+
+        self.assertEqual(len(regressions), len(payload["results"]))
+        self.assertAlmostEqual(regressions[0]["ratio"], 2.0)
+
+    def test_unmatched(self):
+        results = run_benchmarks(sizes=[20, 30], repeats=1, warmup=0, structures=["avl_tree"])
+        payload = results_to_json(results, 1, 0, 42)
+        baseline = {"results": [entry for entry in payload["results"] if entry["size"] == 20]}
+
+        missing = unmatched(payload, baseline)
+
+        self.assertEqual(len(missing), len(payload["results"]) - len(baseline["results"]))
+        self.assertTrue(all(size == 30 for _, _, size in missing))
+
+    def test_main_fails_without_baseline_overlap(self):
+        results = run_benchmarks(sizes=[30], repeats=1, warmup=0, structures=["btree"])
+        save_results(results_to_json(results, 1, 0, 42), "test_bench.json")
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                code = main(["--sizes", "20", "--repeats", "1", "--warmup", "0",
+                             "--structures", "btree", "--baseline", "test_bench.json"])
+        finally:
+            os.remove("test_bench.json")
+
+        self.assertEqual(code, 2)
+        self.assertIn("NOT IN BASELINE btree search size=20", output.getvalue())
+        self.assertNotIn("No regressions", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,150 +1,182 @@
 import unittest
-import timeit
-import random
-import string
 import os
-from car_avl_tree import Car, AVLTree
+from car_avl_tree import Car, AVLTree, InstrumentedAVLTree
 
 
-class TestAVLTree(unittest.TestCase):
+class AVLTreeInterfaceTests:
+    tree_class = None
 
     def setUp(self):
-        self.avl_tree = AVLTree()
+        self.tree = self.tree_class()
 
         self.car1 = Car("Toyota", "JT2BF22K1W0123456", 2.0, 25000, 180)
         self.car2 = Car("Honda", "1HGCM82633A004852", 1.8, 22000, 175)
         self.car3 = Car("Ford", "1FAHP3EN2AW123456", 2.5, 28000, 190)
 
     def test_insert_and_search(self):
-        self.avl_tree.insert(self.car1)
-        self.avl_tree.insert(self.car2)
+        self.tree.insert(self.car1)
+        self.tree.insert(self.car2)
 
-        self.assertEqual(self.avl_tree.search(25000), self.car1)
-        self.assertEqual(self.avl_tree.search(22000), self.car2)
-        self.assertIsNone(self.avl_tree.search(30000))
+        self.assertEqual(self.tree.search(25000), self.car1)
+        self.assertEqual(self.tree.search(22000), self.car2)
+        self.assertIsNone(self.tree.search(30000))
 
     def test_delete(self):
-        self.avl_tree.insert(self.car1)
-        self.avl_tree.insert(self.car2)
-        self.avl_tree.insert(self.car3)
+        self.tree.insert(self.car1)
+        self.tree.insert(self.car2)
+        self.tree.insert(self.car3)
 
-        self.avl_tree.delete(25000)
+        self.tree.delete(25000)
 
-        self.assertIsNone(self.avl_tree.search(25000))
-        self.assertIsNotNone(self.avl_tree.search(22000))
-        self.assertIsNotNone(self.avl_tree.search(28000))
+        self.assertIsNone(self.tree.search(25000))
+        self.assertIsNotNone(self.tree.search(22000))
+        self.assertIsNotNone(self.tree.search(28000))
 
     def test_contains(self):
-        self.avl_tree.insert(self.car1)
-        self.avl_tree.insert(self.car2)
+        self.tree.insert(self.car1)
+        self.tree.insert(self.car2)
 
-        self.assertTrue(self.avl_tree.contains(self.car1))
-        self.assertTrue(self.avl_tree.contains(self.car2))
-        self.assertFalse(self.avl_tree.contains(self.car3))
+        self.assertTrue(self.tree.contains(self.car1))
+        self.assertTrue(self.tree.contains(self.car2))
+        self.assertFalse(self.tree.contains(self.car3))
 
     def test_contains_by_vin(self):
-        self.avl_tree.insert(self.car1)
-        self.avl_tree.insert(self.car2)
+        self.tree.insert(self.car1)
+        self.tree.insert(self.car2)
 
-        self.assertTrue(self.avl_tree.contains_by_vin("JT2BF22K1W0123456"))
-        self.assertTrue(self.avl_tree.contains_by_vin("1HGCM82633A004852"))
-        self.assertFalse(self.avl_tree.contains_by_vin("1FAHP3EN2AW123456"))
+        self.assertTrue(self.tree.contains_by_vin("JT2BF22K1W0123456"))
+        self.assertTrue(self.tree.contains_by_vin("1HGCM82633A004852"))
+        self.assertFalse(self.tree.contains_by_vin("1FAHP3EN2AW123456"))
 
     def test_save_load_file(self):
-        self.avl_tree.insert(self.car1)
-        self.avl_tree.insert(self.car2)
+        self.tree.insert(self.car1)
+        self.tree.insert(self.car2)
 
-        self.avl_tree.save_to_file("test_avl_tree.pkl")
+        self.tree.save_to_file("test_avl_tree.pkl")
 
-        new_avl_tree = AVLTree()
+        new_tree = self.tree_class()
 
-        new_avl_tree.load_from_file("test_avl_tree.pkl")
+        new_tree.load_from_file("test_avl_tree.pkl")
 
-        self.assertTrue(new_avl_tree.contains(self.car1))
-        self.assertTrue(new_avl_tree.contains(self.car2))
+        self.assertTrue(new_tree.contains(self.car1))
+        self.assertTrue(new_tree.contains(self.car2))
 
         os.remove("test_avl_tree.pkl")
 
+    def test_duplicate_insert(self):
+        self.tree.insert(self.car1)
+        self.tree.insert(Car("Toyota2", "JT2BF22K1W0123456", 2., 25000, 180))
+
+        found_car = self.tree.search(25000)
+
+        self.assertEqual(found_car.vin, "JT2BF22K1W0123456")
+
+    def test_range_search(self):
+        self.tree.insert(self.car1)
+        self.tree.insert(self.car2)
+        self.tree.insert(self.car3)
+
+        self.assertEqual(self.tree.range_search(22000, 25000), [self.car2, self.car1])
+        self.assertEqual(self.tree.range_search(23000, 30000), [self.car1, self.car3])
+        self.assertEqual(self.tree.range_search(30000, 40000), [])
+
+
+class TestAVLTree(AVLTreeInterfaceTests, unittest.TestCase):
+    tree_class = AVLTree
+
     def test_balance(self):
         for i in range(1, 8):
-            self.avl_tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
+            self.tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
 
-        self.assertEqual(self.avl_tree.root.height, 3)
+        self.assertEqual(self.tree.root.height, 3)
 
-    def test_duplicate_insert(self):
-        self.avl_tree.insert(self.car1)
-        self.avl_tree.insert(Car("Toyota2", "JT2BF22K1W0123456", 2., 25000, 180))
-
-        found_car = self.avl_tree.search(25000)
 
-        self.assertEqual(found_car.vin, "JT2BF22K1W0123456")
+class TestInstrumentedAVLTreeInterface(AVLTreeInterfaceTests, unittest.TestCase):
+    tree_class = InstrumentedAVLTree
 
 
-def generate_random_car():
-    return Car(
-        ''.join(random.choices(string.ascii_uppercase, k=5)),
-        ''.join(random.choices(string.ascii_uppercase + string.digits, k=17)),
-        round(random.uniform(1.0, 5.0), 1),
-        round(random.uniform(10000, 100000), -3),
-        round(random.uniform(120, 250), 0))
+class TestInstrumentedAVLTree(unittest.TestCase):
 
+    def setUp(self):
+        self.events = []
+        self.avl_tree = InstrumentedAVLTree(callback=self.events.append)
 
-def benchmark_insert(n):
-    avl_tree = AVLTree()
+    def test_behaves_like_avl_tree(self):
+        for i in range(1, 8):
+            self.avl_tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
 
-    for _ in range(n):
-        avl_tree.insert(generate_random_car())
+        self.assertEqual(self.avl_tree.root.height, 3)
+        self.assertEqual(self.avl_tree.search(30000).vin, "VIN3")
+        self.assertTrue(self.avl_tree.contains_by_vin("VIN7"))
 
+        self.avl_tree.delete(40000)
 
-def benchmark_search(n):
-    avl_tree = AVLTree()
+        self.assertIsNone(self.avl_tree.search(40000))
 
-    cars = [generate_random_car() for _ in range(n)]
+    def test_rotations(self):
+        for i in range(1, 4):
+            self.avl_tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
 
-    for car in cars:
-        avl_tree.insert(car)
+        self.assertEqual([event.rotations for event in self.events], [0, 0, 1])
+        self.assertEqual(self.avl_tree.stats()["operations"]["insert"]["rotations"], 1)
 
-    for _ in range(n):
-        avl_tree.search(random.choice(cars).price)
+    def test_search_counts(self):
+        for i in range(1, 8):
+            self.avl_tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
+        self.events.clear()
 
+        self.avl_tree.search(40000)
+        self.avl_tree.search(10000)
+        self.avl_tree.contains(Car("Brand9", "VIN9", 2., 90000, 180))
 
-def benchmark_delete(n):
-    avl_tree = AVLTree()
+        root, leaf, missing = self.events
+        self.assertEqual((root.nodes_visited, root.comparisons), (1, 1))
+        self.assertEqual((leaf.nodes_visited, leaf.comparisons), (3, 5))
+        self.assertEqual(missing.operation, "contains")
+        self.assertEqual(missing.nodes_visited, 3)
 
-    cars = [generate_random_car() for _ in range(n)]
+    def test_delete_counts_successor_walk(self):
+        for i in range(1, 8):
+            self.avl_tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
+        self.events.clear()
 
-    for car in cars:
-        avl_tree.insert(car)
+        self.avl_tree.delete(40000)
 
-    for car in cars:
-        avl_tree.delete(car.price)
+        # Root (1) + successor walk 60000 -> 50000 (2) + successor delete 60000 -> 50000 (2).
+        self.assertEqual(self.events[0].nodes_visited, 5)
 
+    def test_range_search_counts(self):
+        for i in range(1, 8):
+            self.avl_tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
+        self.events.clear()
 
-def benchmark_contains_by_vin(n):
-    avl_tree = AVLTree()
+        cars = self.avl_tree.range_search(50000, 70000)
 
-    cars = [generate_random_car() for _ in range(n)]
+        self.assertEqual([car.vin for car in cars], ["VIN5", "VIN6", "VIN7"])
+        event = self.events[0]
+        self.assertEqual(event.operation, "range_search")
+        self.assertEqual((event.nodes_visited, event.comparisons), (4, 15))
+        self.assertEqual(self.avl_tree.stats()["operations"]["range_search"]["count"], 1)
 
-    for car in cars:
-        avl_tree.insert(car)
+    def test_contains_by_vin_scan_length(self):
+        for i in range(1, 8):
+            self.avl_tree.insert(Car(f"Brand{i}", f"VIN{i}", 2., i * 10000, 180))
 
-    for _ in range(n):
-        avl_tree.contains_by_vin(random.choice(cars).vin)
+        self.avl_tree.contains_by_vin("MISSING")
 
+        stats = self.avl_tree.stats()
+        self.assertEqual(stats["height"], 3)
+        self.assertEqual(stats["operations"]["contains_by_vin"]["max_nodes_visited"], 7)
 
-def run_benchmarks():
-    sizes = [100, 1000, 10000]
+    def test_latency_histogram(self):
+        self.avl_tree.insert(Car("Toyota", "JT2BF22K1W0123456", 2.0, 25000, 180))
+        self.avl_tree.insert(Car("Honda", "1HGCM82633A004852", 1.8, 22000, 175))
 
-    for size in sizes:
-        print(f"\nBenchmarks for size {size}:")
-        print(f"Insert: {timeit.timeit(lambda: benchmark_insert(size), number=1):.6f} seconds")
-        print(f"Search: {timeit.timeit(lambda: benchmark_search(size), number=1):.6f} seconds")
-        print(f"Delete: {timeit.timeit(lambda: benchmark_delete(size), number=1):.6f} seconds")
-        print(f"Contains by VIN: {timeit.timeit(lambda: benchmark_contains_by_vin(size), number=1):.6f} seconds")
+        insert_stats = self.avl_tree.stats()["operations"]["insert"]
+        self.assertEqual(insert_stats["count"], 2)
+        self.assertEqual(sum(insert_stats["histogram"].values()), 2)
+        self.assertLess(insert_stats["max_ns"], max(insert_stats["histogram"]))
 
 
 if __name__ == "__main__":
-    print("Running tests:")
     unittest.main()
-    print("\nRunning benchmarks:")
-    run_benchmarks()
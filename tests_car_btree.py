@@ -0,0 +1,128 @@
+import unittest
+import random
+import os
+from functools import partial
+from car_avl_tree import Car, AVLTree
+from car_btree import BTree, LeafNode, InternalNode
+from tests_car_avl_tree import AVLTreeInterfaceTests
+
+
+def make_car(price):
+    return Car(f"Brand{price}", f"VIN{price}", 2., price, 180)
+
+
+class TestBTree(AVLTreeInterfaceTests, unittest.TestCase):
+    tree_class = BTree
+
+
+class TestSmallFanoutBTree(AVLTreeInterfaceTests, unittest.TestCase):
+    tree_class = partial(BTree, fanout=3)
+
+    def check_invariants(self, tree):
+        depths = set()
+
+        def walk(node, low, high, depth, is_root):
+            self.assertEqual(node.keys, sorted(node.keys))
+            for key in node.keys:
+                self.assertTrue(low is None or key >= low)
+                self.assertTrue(high is None or key < high)
+            if isinstance(node, LeafNode):
+                depths.add(depth)
+                self.assertEqual(node.keys, [car.price for car in node.cars])
+                self.assertLessEqual(len(node.keys), tree.max_keys)
+                if not is_root:
+                    self.assertGreaterEqual(len(node.keys), tree.min_leaf_keys)
+                return
+            self.assertEqual(len(node.children), len(node.keys) + 1)
+            self.assertLessEqual(len(node.children), tree.fanout)
+            if not is_root:
+                self.assertGreaterEqual(len(node.children), tree.min_children)
+            bounds = [low] + node.keys + [high]
+            for i, child in enumerate(node.children):
+                walk(child, bounds[i], bounds[i + 1], depth + 1, False)
+
+        walk(tree.root, None, None, 0, True)
+        self.assertEqual(len(depths), 1)
+
+        linked = []
+        leaf = tree._leftmost_leaf()
+        while leaf is not None:
+            linked.extend(leaf.keys)
+            leaf = leaf.next
+        self.assertEqual(linked, sorted(linked))
+        return linked
+
+    def test_random_operations_match_avl_tree(self):
+        rng = random.Random(1)
+        avl_tree = AVLTree()
+        prices = list(range(0, 2000, 10))
+
+        for _ in range(1500):
+            price = rng.choice(prices)
+            if rng.random() < 0.6:
+                car = Car("Brand", f"VIN{rng.random()}", 2., price, 180)
+                self.tree.insert(car)
+                avl_tree.insert(car)
+            else:
+                self.tree.delete(price)
+                avl_tree.delete(price)
+
+        keys = self.check_invariants(self.tree)
+        self.assertEqual(keys, [car.price for car in avl_tree._inorder_traversal(avl_tree.root)])
+        for price in prices:
+            self.assertEqual(self.tree.search(price), avl_tree.search(price))
+        self.assertEqual(self.tree.range_search(500, 1500), avl_tree.range_search(500, 1500))
+
+    def test_delete_all(self):
+        for price in range(100):
+            self.tree.insert(make_car(price))
+        for price in range(0, 100, 2):
+            self.tree.delete(price)
+        self.check_invariants(self.tree)
+        for price in range(1, 100, 2):
+            self.tree.delete(price)
+
+        self.assertIsInstance(self.tree.root, LeafNode)
+        self.assertEqual(self.tree.root.keys, [])
+        self.assertIsNone(self.tree.search(1))
+
+    def test_bulk_load(self):
+        cars = [make_car(price) for price in range(50, 0, -1)]
+        cars.append(Car("Duplicate", "VINDUP", 2., 10, 180))
+
+        self.tree.bulk_load(cars)
+
+        keys = self.check_invariants(self.tree)
+        self.assertEqual(keys, list(range(1, 51)))
+        self.assertEqual(self.tree.search(10).vin, "VINDUP")
+        self.assertIsInstance(self.tree.root, InternalNode)
+
+        self.tree.insert(make_car(51))
+        self.tree.delete(25)
+        self.check_invariants(self.tree)
+
+    def test_bulk_load_empty(self):
+        self.tree.insert(make_car(1))
+        self.tree.bulk_load([])
+
+        self.assertIsNone(self.tree.search(1))
+
+    def test_load_from_avl_tree_file(self):
+        avl_tree = AVLTree()
+        for price in range(20):
+            avl_tree.insert(make_car(price))
+        avl_tree.save_to_file("test_btree.pkl")
+
+        self.tree.load_from_file("test_btree.pkl")
+        os.remove("test_btree.pkl")
+
+        self.assertEqual(self.check_invariants(self.tree), list(range(20)))
+        self.assertTrue(self.tree.contains_by_vin("VIN19"))
+
+    def test_invalid_fanout(self):
+        with self.assertRaises(ValueError):
+            BTree(fanout=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
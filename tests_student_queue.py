@@ -1,9 +1,6 @@
 import unittest
-import timeit
-import random
-import string
 import os
-from student_queue import Student, StudentQueue
+from student_queue import Student, StudentQueue, InstrumentedStudentQueue
 
 
 class TestStudentQueue(unittest.TestCase):
@@ -64,58 +61,48 @@ class TestStudentQueue(unittest.TestCase):
         os.remove("test_queue.pkl")
 
 
-def generate_random_student():
-    return Student(
-        ''.join(random.choices(string.ascii_letters, k=10)),
-        f"Group{random.randint(1, 5)}",
-        random.randint(1, 5),
-        random.randint(18, 25),
-        round(random.uniform(2.0, 5.0), 1)
-    )
-
-
-def benchmark_enqueue(n):
-    queue = StudentQueue()
-    for _ in range(n):
-        queue.enqueue(generate_random_student())
+class TestInstrumentedStudentQueue(unittest.TestCase):
 
+    def setUp(self):
+        self.events = []
+        self.queue = InstrumentedStudentQueue(callback=self.events.append)
+        self.student1 = Student("Иван Иванов", "Группа1", 2, 20, 4.5)
+        self.student2 = Student("Петр Петров", "Группа2", 3, 21, 4.2)
+        self.student3 = Student("Анна Сидорова", "Группа1", 2, 19, 4.8)
 
-def benchmark_dequeue(n):
-    queue = StudentQueue()
-    for _ in range(n):
-        queue.enqueue(generate_random_student())
-    for _ in range(n):
-        queue.dequeue()
+    def test_behaves_like_queue(self):
+        self.queue.enqueue(self.student1)
+        self.queue.enqueue(self.student2)
+        self.queue.reverse()
 
+        self.assertEqual(len(self.queue), 2)
+        self.assertTrue(self.queue.contains(self.student1))
+        self.assertFalse(self.queue.contains_by_name("Анна Сидорова"))
+        self.assertEqual(self.queue.dequeue(), self.student2)
 
-def benchmark_reverse(n):
-    queue = StudentQueue()
-    for _ in range(n):
-        queue.enqueue(generate_random_student())
-    queue.reverse()
+    def test_scan_length(self):
+        self.queue.enqueue(self.student1)
+        self.queue.enqueue(self.student2)
+        self.queue.enqueue(self.student3)
+        self.events.clear()
 
+        self.queue.contains_by_name("Петр Петров")
+        self.queue.contains(self.student3)
+        self.queue.contains_by_name("Нет Такого")
 
-def benchmark_contains(n):
-    queue = StudentQueue()
-    students = [generate_random_student() for _ in range(n)]
-    for student in students:
-        queue.enqueue(student)
-    for _ in range(n):
-        queue.contains(random.choice(students))
+        self.assertEqual([event.nodes_visited for event in self.events], [2, 3, 3])
 
+    def test_stats(self):
+        self.queue.enqueue(self.student1)
+        self.queue.enqueue(self.student2)
+        self.queue.dequeue()
 
-def run_benchmarks():
-    sizes = [100, 1000, 10000]
-    for size in sizes:
-        print(f"\nBenchmarks for size {size}:")
-        print(f"Enqueue: {timeit.timeit(lambda: benchmark_enqueue(size), number=1):.6f} seconds")
-        print(f"Dequeue: {timeit.timeit(lambda: benchmark_dequeue(size), number=1):.6f} seconds")
-        print(f"Reverse: {timeit.timeit(lambda: benchmark_reverse(size), number=1):.6f} seconds")
-        print(f"Contains: {timeit.timeit(lambda: benchmark_contains(size), number=1):.6f} seconds")
+        stats = self.queue.stats()
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["operations"]["enqueue"]["count"], 2)
+        self.assertEqual(stats["operations"]["dequeue"]["count"], 1)
+        self.assertEqual(sum(stats["operations"]["enqueue"]["histogram"].values()), 2)
 
 
 if __name__ == "__main__":
-    print("Running tests:")
     unittest.main()
-    print("\nRunning benchmarks:")
-    run_benchmarks()